@@ -13,11 +13,21 @@ Dependencies:
     - Migrate: For handling database migrations.
     - Api: For creating a RESTful API.
     - SQLAlchemy: For handling database operations.
+    - orjson: For fast JSON serialization.
 """
 
+import multiprocessing
 import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import IO, Any, Dict, Optional, Union
 
-from flask import Flask
+import click
+import orjson
+from alembic import command
+from flask import Flask, Request, Response, current_app, make_response
+from flask.json.provider import DefaultJSONProvider
+from flask_caching import Cache
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 from flask_migrate import Migrate
@@ -25,9 +35,113 @@ from flask_restx import Api
 from flask_sqlalchemy import SQLAlchemy
 
 db = SQLAlchemy()
+cache = Cache()
 limiter = Limiter(key_func=get_remote_address)
 authorizations = {"apikey": {"type": "apiKey",
                              "in": "header", "name": "X-API-Key"}}
+# Alembic migrations that bring existing databases up to date with the models.
+MIGRATIONS_DIRECTORY = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "migrations"
+)
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    JSON provider that serializes with orjson instead of the json module.
+
+    Types orjson does not handle natively fall back to Flask's default
+    conversions.
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """
+        Serialize data as JSON.
+
+        Args:
+            obj (Any): The data to serialize.
+            **kwargs (Any): Honors sort_keys and indent like json.dumps.
+
+        Returns:
+            str: The JSON document.
+        """
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        """
+        Deserialize JSON data.
+
+        Args:
+            s (Union[str, bytes]): The JSON document.
+            **kwargs (Any): Ignored.
+
+        Returns:
+            Any: The deserialized data.
+        """
+        return orjson.loads(s)
+
+
+class UploadRequest(Request):
+    """
+    Request that spools uploaded files into the upload folder.
+
+    Werkzeug buffers large uploads in anonymous temporary files, so saving
+    one copies it again. Spooling to a named file next to the uploads lets
+    it be hard-linked into place instead.
+    """
+
+    def _get_file_stream(
+        self,
+        total_content_length: Optional[int],
+        content_type: Optional[str],
+        filename: Optional[str] = None,
+        content_length: Optional[int] = None,
+    ) -> IO[bytes]:
+        """
+        Get the stream an uploaded file is written to.
+
+        Args:
+            total_content_length (Optional[int]): The length of the request body.
+            content_type (Optional[str]): The mimetype of the uploaded file.
+            filename (Optional[str], optional): The name of the uploaded file.
+            content_length (Optional[int], optional): The length of the file.
+
+        Returns:
+            IO[bytes]: A temporary file in the upload folder, removed when the
+                request is closed.
+        """
+        return tempfile.NamedTemporaryFile(
+            mode="rb+", dir=current_app.config["UPLOAD_FOLDER"], suffix=".part"
+        )
+
+
+def output_json(
+    data: Any, code: int, headers: Optional[Dict[str, str]] = None
+) -> Response:
+    """
+    Make a Flask-RESTX JSON response with the application's JSON provider.
+
+    Flask-RESTX serializes resource return values with the json module by
+    default; this keeps them on orjson like the rest of the application.
+
+    Args:
+        data (Any): The data to serialize.
+        code (int): The HTTP status code.
+        headers (Optional[Dict[str, str]], optional): Extra response headers.
+            Defaults to None.
+
+    Returns:
+        Response: The JSON response.
+    """
+    dumped = current_app.json.dumps(data, sort_keys=False, indent=current_app.debug)
+    response = make_response(dumped + "\n", code)
+    response.headers.extend(headers or {})
+    return response
+
 
 # Flask application factory function with docstrings
 
@@ -45,33 +159,56 @@ def create_app() -> Flask:
         Flask: The configured Flask application instance.
     """
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
+    app.request_class = UploadRequest
     app.config.from_object("config.Config")
-    # Define the UPLOAD_FOLDER path
-    app.config["UPLOAD_FOLDER"] = "uploads/"
-    # Define the 150MB limit app wide
-    app.config["MAX_CONTENT_LENGTH"] = 150 * 1000 * 1000
     # Ensure the UPLOAD_FOLDER exists
-    try:
-        os.makedirs(app.config["UPLOAD_FOLDER"])
-        os.chmod("uploads/", 0o755)
-
-    except FileExistsError:
-        pass
-    app.config["SQLALCHEMY_DATABASE_URI"] = os.environ.get("DATABASE_URL") if os.environ.get("DATABASE_URL") is not None else "sqlite:///app.db"
+    os.makedirs(app.config["UPLOAD_FOLDER"], mode=0o755, exist_ok=True)
+    # Keep the saved similarity index in the instance folder by default
+    if app.config["SIMILARITY_INDEX_PATH"] is None:
+        app.config["SIMILARITY_INDEX_PATH"] = os.path.join(
+            app.instance_path, "similarity_index.joblib"
+        )
+        os.makedirs(app.instance_path, exist_ok=True)
     db.init_app(app)
-    Migrate(app, db)
+    migrate = Migrate(app, db, directory=MIGRATIONS_DIRECTORY)
     limiter.init_app(app)
+    cache.init_app(app)
+    # Uploaded CSV files are imported in the background
+    app.extensions["ingest_executor"] = ThreadPoolExecutor(
+        max_workers=app.config["INGEST_WORKERS"], thread_name_prefix="ingest"
+    )
+    # Large CSV files can be parsed in worker processes to use more than one
+    # core. Workers come from a fork server, as the submitting process is
+    # multi-threaded and holds pooled database connections.
+    if app.config["INGEST_PROCESSES"]:
+        app.extensions["ingest_processes"] = ProcessPoolExecutor(
+            max_workers=app.config["INGEST_PROCESSES"],
+            mp_context=multiprocessing.get_context("forkserver"),
+        )
     api = Api(app, doc="/docs", authorizations=authorizations, security="apikey")
+    api.representation("application/json")(output_json)
     with app.app_context():
         from . import views
+        from .utils import seed_sample_data
 
         api.add_namespace(views.api, path="/api")
         # Create tables if they do not exist
         db.create_all()
+        # Add columns and indexes missing from databases created earlier
+        migrate_config = migrate.get_config()
+        migrate_config.attributes["configure_logger"] = False
+        command.upgrade(migrate_config, "head")
         # Import sample CSV data if the table is empty
-        if not db.session.query(views.GameData).first():
-            from .utils import import_sample_data, import_sample_events
+        if app.config["SEED_SAMPLE_DATA"]:
+            seed_sample_data()
+
+    @app.cli.command("seed-data")
+    def seed_data() -> None:
+        """Import the sample CSV data into an empty database."""
+        if seed_sample_data():
+            click.echo("Imported sample data.")
+        else:
+            click.echo("Game data already present, skipped sample import.")
 
-            import_sample_events()
-            import_sample_data()
     return app
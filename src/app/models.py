@@ -6,6 +6,8 @@ store event details and game data respectively.
 
 from typing import Dict, Union
 
+from sqlalchemy import DDL, event
+
 from . import db
 
 
@@ -22,6 +24,9 @@ class Event(db.Model):
         encoding (str): The encoding format of the event data file.
         delimiter (str): The delimiter used in the event data file.
         created_at (datetime): The timestamp when the event was created.
+        status (str): The import status: pending, completed or failed.
+        error (str): Why the import failed, if it did.
+        games (List[GameData]): The game data imported by the event.
     """
 
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
@@ -32,6 +37,46 @@ class Event(db.Model):
     encoding = db.Column(db.String(50), nullable=False)
     delimiter = db.Column(db.String(5), nullable=False)
     created_at = db.Column(db.DateTime, server_default=db.func.now())
+    status = db.Column(db.String(20), nullable=False, default="pending")
+    error = db.Column(db.Text, nullable=True)
+    # An event can own a whole CSV import, so the collection is never loaded
+    # implicitly; request it with selectinload() where it is needed.
+    games = db.relationship("GameData", back_populates="event", lazy="raise")
+
+    def to_dict(self) -> Dict[str, Union[int, str, None]]:
+        """
+        Convert the Event instance into a dictionary.
+
+        Returns:
+            Dict[str, Union[int, str, None]]: The event as a dictionary.
+        """
+        return {
+            "id": self.id,
+            "original_url": self.original_url,
+            "mode": self.mode,
+            "altname": self.altname,
+            "filepath": self.filepath,
+            "encoding": self.encoding,
+            "delimiter": self.delimiter,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "status": self.status,
+            "error": self.error,
+        }
+
+
+# Text columns filtered with substring matches in /query.
+TRIGRAM_INDEX_COLUMNS = [
+    "name",
+    "about_game",
+    "supported_languages",
+    "developers",
+    "publishers",
+    "categories",
+    "genres",
+    "tags",
+]
+# Text columns that /query can also match by prefix.
+PREFIX_INDEX_COLUMNS = ["name", "developers", "publishers"]
 
 
 class GameData(db.Model):
@@ -60,12 +105,40 @@ class GameData(db.Model):
         genres (str): The genres of the game.
         tags (str): The tags associated with the game.
         event_id (int): The ID of the associated event.
+        combined_features (str): The description, categories, genres and tags
+            joined into one text, generated by the database for similarity search.
+        event (Event): The event that imported the game data.
     """
 
+    __table_args__ = (
+        db.Index("ix_game_data_price_release_date", "price", "release_date"),
+        db.Index("ix_game_data_positive_negative", "positive", "negative"),
+        # Trigram indexes so substring (ILIKE '%value%') filters on PostgreSQL
+        # can avoid a sequential scan.
+        *(
+            db.Index(
+                f"ix_game_data_{column}_trgm",
+                column,
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+            ).ddl_if(dialect="postgresql")
+            for column in TRIGRAM_INDEX_COLUMNS
+        ),
+        # Pattern indexes so prefix (lower(column) LIKE 'value%') filters on
+        # PostgreSQL become btree range scans.
+        *(
+            db.Index(
+                f"ix_game_data_{column}_prefix",
+                db.text(f"lower({column}) text_pattern_ops"),
+            ).ddl_if(dialect="postgresql")
+            for column in PREFIX_INDEX_COLUMNS
+        ),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
-    app_id = db.Column(db.Integer, nullable=False)
+    app_id = db.Column(db.Integer, nullable=False, index=True)
     name = db.Column(db.String(255), nullable=False)
-    release_date = db.Column(db.String(255), nullable=True)
+    release_date = db.Column(db.String(255), nullable=True, index=True)
     required_age = db.Column(db.Integer, nullable=True)
     price = db.Column(db.Float, nullable=True)
     dlc_count = db.Column(db.Integer, nullable=True)
@@ -83,6 +156,15 @@ class GameData(db.Model):
     genres = db.Column(db.String(255), nullable=True)
     tags = db.Column(db.String(255), nullable=True)
     event_id = db.Column(db.Integer, db.ForeignKey("event.id"), nullable=False)
+    combined_features = db.Column(
+        db.Text,
+        db.Computed(
+            "COALESCE(about_game, '') || ' ' || COALESCE(categories, '') || ' ' "
+            "|| COALESCE(genres, '') || ' ' || COALESCE(tags, '')",
+            persisted=True,
+        ),
+    )
+    event = db.relationship("Event", back_populates="games", lazy="joined")
 
     def to_dict(self) -> Dict[str, Union[int, str, float, bool]]:
         """
@@ -114,3 +196,10 @@ class GameData(db.Model):
             "tags": self.tags,
             "event_id": self.event_id,
         }
+
+
+event.listen(
+    GameData.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
@@ -5,19 +5,173 @@ This module includes functions to load game data, find similar games,
 perform data queries and aggregations, and import sample data into the database.
 """
 
+import io
+import os
+import tempfile
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from decimal import Decimal
+from functools import lru_cache
+from itertools import chain, islice
+from operator import itemgetter
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
 
+import joblib
 import numpy as np
 import pandas as pd
-from fuzzywuzzy import process
-from scipy.stats import kurtosis, skew
+import requests
+from flask import current_app
+from rapidfuzz import fuzz, process, utils
+from requests.adapters import HTTPAdapter
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-from sqlalchemy import and_
+from sqlalchemy import func, select, text
+from urllib3.util.retry import Retry
 
-from . import db
-from .models import Event, GameData
+from . import cache, db
+from .models import PREFIX_INDEX_COLUMNS, Event, GameData
+
+# Mapping of CSV headers to the GameData attributes they populate.
+GAME_DATA_COLUMNS = {
+    "AppID": "app_id",
+    "Name": "name",
+    "Release date": "release_date",
+    "Required age": "required_age",
+    "Price": "price",
+    "DLC count": "dlc_count",
+    "About the game": "about_game",
+    "Supported languages": "supported_languages",
+    "Windows": "windows",
+    "Mac": "mac",
+    "Linux": "linux",
+    "Positive": "positive",
+    "Negative": "negative",
+    "Score rank": "score_rank",
+    "Developers": "developers",
+    "Publishers": "publishers",
+    "Categories": "categories",
+    "Genres": "genres",
+    "Tags": "tags",
+}
+# GameData columns returned by /query, in response order. Generated columns
+# are internal to the similarity search.
+RESULT_COLUMNS = [
+    column for column in GameData.__table__.columns if column.computed is None
+]
+RESULT_KEYS = tuple(column.key for column in RESULT_COLUMNS)
+EVENT_COLUMNS = [
+    "original_url",
+    "mode",
+    "altname",
+    "filepath",
+    "encoding",
+    "delimiter",
+    "created_at",
+]
+# Number of rows sent to the database per executemany batch.
+INSERT_BATCH_SIZE = 10_000
+# Number of CSV rows parsed and inserted at a time during ingest.
+CSV_CHUNK_SIZE = 50_000
+# Approximate size in bytes of the CSV ranges parsed by ingest processes.
+CSV_CHUNK_BYTES = 64 * 1024 * 1024
+# Number of /query result rows fetched from the database at a time.
+QUERY_BATCH_SIZE = 1_000
+# Bytes written to disk at a time while downloading an imported CSV.
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+# HTTP session shared by CSV imports, so repeated imports from the same
+# host reuse open connections instead of a new TCP and TLS handshake.
+http_session = requests.Session()
+http_adapter = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    max_retries=Retry(total=2, backoff_factor=0.2),
+)
+http_session.mount("http://", http_adapter)
+http_session.mount("https://", http_adapter)
+
+# Columns and aggregates served by query_aggregate_data, in response order.
+AGGREGATE_COLUMNS = ["price", "dlc_count", "positive", "negative"]
+AGGREGATES = [
+    "min",
+    "max",
+    "median",
+    "mean",
+    "range",
+    "iqr",
+    "std_dev",
+    "variance",
+    "sum",
+    "count",
+    "percentiles",
+    "skewness",
+    "kurtosis",
+]
+
+# Aggregates derived from other statistics, and how to build them.
+_AGGREGATE_STATISTICS = {
+    "range": ["min", "max"],
+    "iqr": ["p25", "p75"],
+    "percentiles": ["p25", "median", "p75"],
+}
+_AGGREGATE_RESULTS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    "range": lambda stats: stats["max"] - stats["min"],
+    "iqr": lambda stats: stats["p75"] - stats["p25"],
+    "percentiles": lambda stats: {
+        "25th": stats["p25"],
+        "50th": stats["median"],
+        "75th": stats["p75"],
+    },
+}
+# Statistics computed by the database on every backend.
+_SQL_STATISTICS: Dict[str, Callable[[Any], Any]] = {
+    "count": func.count,
+    "min": func.min,
+    "max": func.max,
+    "sum": func.sum,
+    "mean": func.avg,
+}
+# Statistics that only PostgreSQL can compute in SQL.
+_POSTGRESQL_STATISTICS: Dict[str, Callable[[Any], Any]] = {
+    "p25": lambda column: func.percentile_cont(0.25).within_group(column),
+    "median": lambda column: func.percentile_cont(0.5).within_group(column),
+    "p75": lambda column: func.percentile_cont(0.75).within_group(column),
+    "std_dev": func.stddev_pop,
+    "variance": func.var_pop,
+}
+# Statistics computed in NumPy from the column values otherwise.
+_ARRAY_STATISTICS = [
+    "p25",
+    "median",
+    "p75",
+    "std_dev",
+    "variance",
+    "skewness",
+    "kurtosis",
+]
+
+# PostgreSQL advisory lock key held while seeding the sample data.
+SEED_LOCK_KEY = 5123
+
+# Fitted TF-IDF state shared by get_similar_games calls, keyed by the
+# game data version it was built from.
+_SIMILARITY_CACHE: Dict[str, Any] = {}
+
+# Bumped whenever the similarity index layout changes, so index files saved
+# by older code are rebuilt instead of loaded.
+SIMILARITY_INDEX_FORMAT = 1
+
+# Number of /similar_games results memoized per process.
+SIMILAR_GAMES_CACHE_SIZE = 1024
 
 
 def load_game_data() -> pd.DataFrame:
@@ -27,33 +181,172 @@ def load_game_data() -> pd.DataFrame:
     Returns:
         pd.DataFrame: A DataFrame containing game data with combined features.
     """
-    games = GameData.query.all()
-    data = [
-        {
-            "app_id": game.app_id,
-            "name": game.name,
-            "release_date": game.release_date,
-            "price": game.price,
-            "about_game": game.about_game,
-            "categories": game.categories,
-            "genres": game.genres,
-            "tags": game.tags,
-        }
-        for game in games
+    columns = [
+        GameData.app_id,
+        GameData.name,
+        GameData.release_date,
+        GameData.price,
+        GameData.combined_features,
     ]
-    df = pd.DataFrame(data)
-    df["combined_features"] = (
-        df["about_game"].fillna("")
-        + " "
-        + df["categories"].fillna("")
-        + " "
-        + df["genres"].fillna("")
-        + " "
-        + df["tags"].fillna("")
-    )
+    rows = iter(db.session.query(*columns).yield_per(5000))
+    df = pd.DataFrame.from_records(rows, columns=[column.key for column in columns])
     return df
 
 
+def game_data_version() -> int:
+    """
+    Get a cheap fingerprint of the game data table.
+
+    Every import marks its event completed in the same transaction as its
+    game data, so the number of completed events changes exactly when new
+    game data becomes visible, even when concurrent imports commit out of
+    order. The event table is small, so counting it stays cheap.
+
+    Returns:
+        int: The number of completed events.
+    """
+    return (
+        db.session.query(func.count(Event.id))
+        .filter(Event.status == "completed")
+        .scalar()
+    )
+
+
+def similarity_index(version: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Get the game data and fitted TF-IDF matrix used for similarity search.
+
+    The index is rebuilt only when the game data has changed since it was
+    last fitted, so repeated requests skip the database load and refit.
+
+    Args:
+        version (Optional[int], optional): The current game data version,
+            if already known. Defaults to None.
+
+    Returns:
+        Dict[str, Any]: The game data DataFrame, its TF-IDF matrix, the
+            game names as stored and preprocessed, the row of each game name,
+            and the data version they were built from.
+    """
+    if version is None:
+        version = game_data_version()
+    index = _SIMILARITY_CACHE.get("index")
+    if index is None or index["version"] != version:
+        path = current_app.config["SIMILARITY_INDEX_PATH"]
+        index = load_similarity_index(path, version)
+        if index is None:
+            index = build_similarity_index(version)
+            if path:
+                save_similarity_index(path, index)
+        _SIMILARITY_CACHE["index"] = index
+    return index
+
+
+def build_similarity_index(version: int) -> Dict[str, Any]:
+    """
+    Load the game data and fit the TF-IDF matrix used for similarity search.
+
+    Args:
+        version (int): The game data version being indexed.
+
+    Returns:
+        Dict[str, Any]: The similarity index for the given version.
+    """
+    df = load_game_data()
+    names = df["name"].tolist()
+    tfidf = TfidfVectorizer(stop_words="english", dtype=np.float32)
+    return {
+        "format": SIMILARITY_INDEX_FORMAT,
+        "version": version,
+        "df": df,
+        "matrix": tfidf.fit_transform(df["combined_features"]),
+        "game_names": names,
+        "names": [process_name(name) for name in names],
+        # Row of the first game with each name.
+        "positions": {
+            name: position for position, name in reversed(list(enumerate(names)))
+        },
+    }
+
+
+def load_similarity_index(
+    path: Optional[str], version: int
+) -> Optional[Dict[str, Any]]:
+    """
+    Load a similarity index saved by another worker or an earlier run.
+
+    Args:
+        path (Optional[str]): The index file path, or None if disabled.
+        version (int): The current game data version.
+
+    Returns:
+        Optional[Dict[str, Any]]: The saved index, or None if there is no
+            usable index for this version.
+    """
+    if not path or not os.path.exists(path):
+        return None
+    # The version is checked from the small sidecar file first, so a stale
+    # index is never unpickled just to find out it is out of date.
+    try:
+        with open(f"{path}.version") as f:
+            saved_version = f.read()
+    except OSError:
+        return None
+    if saved_version != repr(version):
+        return None
+    try:
+        index = joblib.load(path)
+    except Exception:
+        return None
+    if (
+        index.get("format") != SIMILARITY_INDEX_FORMAT
+        or index.get("version") != version
+    ):
+        return None
+    return index
+
+
+def save_similarity_index(path: str, index: Dict[str, Any]) -> None:
+    """
+    Save a similarity index so other workers and restarts can skip the refit.
+
+    The index and its version are each written to a uniquely named
+    temporary file and moved into place, so readers never see a partially
+    written file and concurrent saves do not interfere. Saving is best
+    effort; a failure only means the index is refitted elsewhere.
+
+    Args:
+        path (str): The index file path.
+        index (Dict[str, Any]): The similarity index to save.
+    """
+    try:
+        replace_file(path, lambda f: joblib.dump(index, f))
+        replace_file(
+            f"{path}.version", lambda f: f.write(repr(index["version"]).encode())
+        )
+    except OSError as e:
+        current_app.logger.warning(f"Could not save the similarity index: {str(e)}")
+
+
+def replace_file(path: str, write: Callable[[IO[bytes]], Any]) -> None:
+    """
+    Write a file through a uniquely named temporary file and move it into place.
+
+    Args:
+        path (str): The file path.
+        write (Callable[[IO[bytes]], Any]): A function writing the contents
+            to the open temporary file.
+    """
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
 def get_similar_games(game_name: str) -> Dict[str, Any]:
     """
     Find similar games based on the input game name.
@@ -64,28 +357,62 @@ def get_similar_games(game_name: str) -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: A dictionary containing the closest match and similar games.
     """
-    df = load_game_data()
+    # Collapse stray whitespace so retried spellings of a name share a cache
+    # entry.
+    game_name = " ".join(game_name.split())
+    return _similar_games(game_name, game_data_version())
+
 
-    tfidf = TfidfVectorizer(stop_words="english")
-    tfidf_matrix = tfidf.fit_transform(df["combined_features"])
-    cosine_sim = cosine_similarity(tfidf_matrix)
+@lru_cache(maxsize=SIMILAR_GAMES_CACHE_SIZE)
+def _similar_games(game_name: str, version: int) -> Dict[str, Any]:
+    """
+    Find similar games for a game name, memoized per game data version.
+
+    Repeated requests for the same name skip the fuzzy match and scoring
+    until new game data is ingested.
 
-    closest_match = find_most_similar_game(game_name, df["name"].tolist())
-    idx = df.index[df["name"] == closest_match].tolist()[0]
-    sim_scores = sorted(
-        list(enumerate(cosine_sim[idx])), key=lambda x: x[1], reverse=True
-    )[1:11]
-    game_indices = [i[0] for i in sim_scores]
+    Args:
+        game_name (str): The name of the game to find similar games for.
+        version (int): The current game data version.
 
+    Returns:
+        Dict[str, Any]: A dictionary containing the closest match and similar games.
+    """
+    index = similarity_index(version)
+    df = index["df"]
+    tfidf_matrix = index["matrix"]
+
+    positions = index["positions"]
+    # Exact titles skip the fuzzy scan over every game name.
+    if game_name in positions:
+        closest_match = game_name
+    else:
+        closest_match = find_most_similar_game(
+            game_name, index["game_names"], index["names"]
+        )
+    idx = positions[closest_match]
+    # TF-IDF rows are L2-normalized, so one sparse dot product against the
+    # matched row gives its cosine similarity to every game.
+    cosine_sim = (tfidf_matrix @ tfidf_matrix[idx].T).toarray().ravel()
+    top = top_k_indices(cosine_sim, 11)[1:]
+    # release_date is stored as text, so the rows are read column-wise and
+    # returned as-is instead of going through format_date per game.
+    similar = df.iloc[top]
     similar_games_info = [
         {
-            "app_id": int(df.iloc[i]["app_id"]),
-            "name": df.iloc[i]["name"],
-            "release_date": format_date(df.iloc[i]["release_date"]),
-            "price": float(df.iloc[i]["price"]),
-            "similarity_score": float(sim_scores[idx][1]),
+            "app_id": app_id,
+            "name": name,
+            "release_date": release_date,
+            "price": price,
+            "similarity_score": score,
         }
-        for idx, i in enumerate(game_indices)
+        for app_id, name, release_date, price, score in zip(
+            similar["app_id"].astype(int).tolist(),
+            similar["name"].tolist(),
+            similar["release_date"].tolist(),
+            similar["price"].astype(float).tolist(),
+            cosine_sim[top].tolist(),
+        )
     ]
 
     return {
@@ -99,19 +426,64 @@ def get_similar_games(game_name: str) -> Dict[str, Any]:
     }
 
 
-def find_most_similar_game(input_name: str, names: List[str]) -> Optional[str]:
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Get the indices of the k highest scores, best first.
+
+    Uses a linear-time partial selection so only the k selected scores are
+    sorted. Ties are ordered by index.
+
+    Args:
+        scores (np.ndarray): The scores to select from.
+        k (int): The number of indices to return.
+
+    Returns:
+        np.ndarray: Up to k indices into scores, ordered by descending score.
+    """
+    k = min(k, len(scores))
+    if k == 0:
+        return np.empty(0, dtype=np.intp)
+    top = np.argpartition(-scores, k - 1)[:k]
+    return top[np.lexsort((top, -scores[top]))]
+
+
+def find_most_similar_game(
+    input_name: str,
+    names: List[str],
+    processed_names: Optional[List[Optional[str]]] = None,
+) -> Optional[str]:
     """
     Find the most similar game name from a list of names.
 
     Args:
         input_name (str): The input game name to match.
         names (List[str]): A list of game names to search from.
+        processed_names (Optional[List[Optional[str]]]): The names already
+            normalized with process_name, so repeated lookups skip it.
 
     Returns:
         Optional[str]: The most similar game name, or None if no match is found.
     """
-    match = process.extractOne(input_name, names)
-    return match[0] if match else None
+    if processed_names is None:
+        processed_names = [process_name(name) for name in names]
+    match = process.extractOne(
+        process_name(input_name), processed_names, scorer=fuzz.WRatio
+    )
+    return names[match[2]] if match else None
+
+
+def process_name(name: Optional[str]) -> Optional[str]:
+    """
+    Normalize a game name for fuzzy matching.
+
+    Args:
+        name (Optional[str]): The game name.
+
+    Returns:
+        Optional[str]: The lowercased name without punctuation, or None if
+            the name is missing.
+    """
+    return utils.default_process(name) if isinstance(name, str) else None
 
 
 def format_date(date_value: Any) -> str:
@@ -150,7 +522,35 @@ def parse_date(date_str: str) -> str:
             date = datetime.strptime(f"{month} {day}, {year}", "%b %d, %Y")
         except ValueError:
             date = datetime(1970, 1, 1)
-    return date.strftime("%Y-%m-%d")
+    return date.date().isoformat()
+
+
+def parse_dates(dates: pd.Series) -> pd.Series:
+    """
+    Parse a column of date strings into a standardized format.
+
+    The common 'Mon DD, YYYY' format and its full month name variant are
+    parsed in vectorized passes; only the values neither can handle fall
+    back to parse_date.
+
+    Args:
+        dates (pd.Series): The date strings to parse.
+
+    Returns:
+        pd.Series: Formatted date strings in 'YYYY-MM-DD' format, or None
+            where the input was missing.
+    """
+    parsed = pd.to_datetime(dates, format="%b %d, %Y", errors="coerce")
+    unparsed = parsed.isna() & dates.notna()
+    if unparsed.any():
+        parsed[unparsed] = pd.to_datetime(
+            dates[unparsed], format="%B %d, %Y", errors="coerce"
+        )
+    result = parsed.dt.strftime("%Y-%m-%d").astype(object)
+    fallback = parsed.isna() & dates.notna()
+    if fallback.any():
+        result[fallback] = dates[fallback].map(parse_date)
+    return result.where(result.notnull(), None)
 
 
 def save_csv_to_db(
@@ -162,101 +562,513 @@ def save_csv_to_db(
     """
     Save data from a CSV file to the database.
 
+    Files larger than one chunk are parsed in the ingest processes when they
+    are enabled, so parsing uses more than one core while rows are inserted.
+
     Args:
         csv_file_path (str): The path to the CSV file.
         encoding (str, optional): The encoding of the CSV file. Defaults to "utf-8".
         delimiter (str, optional): The delimiter used in the CSV file. Defaults to ",".
         event_id (Optional[int], optional): The ID of the associated event. Defaults to None.
     """
-    data = pd.read_csv(csv_file_path, encoding=encoding, delimiter=delimiter)
-    data = data.where(pd.notnull(data), None)
-    for _, row in data.iterrows():
-        game_data = GameData(
-            app_id=row["AppID"],
-            name=row["Name"],
-            release_date=parse_date(row["Release date"]),
-            required_age=row["Required age"],
-            price=row["Price"],
-            dlc_count=row["DLC count"],
-            about_game=row["About the game"],
-            supported_languages=row["Supported languages"],
-            windows=row["Windows"],
-            mac=row["Mac"],
-            linux=row["Linux"],
-            positive=row["Positive"],
-            negative=row["Negative"],
-            score_rank=row["Score rank"],
-            developers=row["Developers"],
-            publishers=row["Publishers"],
-            categories=row["Categories"],
-            genres=row["Genres"],
-            tags=row["Tags"],
-            event_id=event_id,
+    processes = current_app.extensions.get("ingest_processes")
+    ranges = []
+    if processes is not None and os.path.getsize(csv_file_path) > CSV_CHUNK_BYTES:
+        ranges = csv_byte_ranges(csv_file_path)
+    if len(ranges) > 1:
+        frames = read_csv_ranges(
+            processes,
+            current_app.config["INGEST_PROCESSES"] + 1,
+            csv_file_path,
+            ranges,
+            encoding,
+            delimiter,
+            event_id,
         )
-        db.session.add(game_data)
+    else:
+        frames = read_csv_chunks(csv_file_path, encoding, delimiter, event_id)
+    for frame in frames:
+        insert_game_data(frame)
     db.session.commit()
 
 
+def read_csv_chunks(
+    csv_file_path: str,
+    encoding: str = "utf-8",
+    delimiter: str = ",",
+    event_id: Optional[int] = None,
+) -> Iterator[pd.DataFrame]:
+    """
+    Read a CSV file as GameData frames of CSV_CHUNK_SIZE rows.
+
+    Args:
+        csv_file_path (str): The path to the CSV file.
+        encoding (str, optional): The encoding of the CSV file. Defaults to "utf-8".
+        delimiter (str, optional): The delimiter used in the CSV file. Defaults to ",".
+        event_id (Optional[int], optional): The ID of the associated event. Defaults to None.
+
+    Yields:
+        pd.DataFrame: The converted chunks, in file order.
+    """
+    with pd.read_csv(
+        csv_file_path,
+        encoding=encoding,
+        delimiter=delimiter,
+        # Skip parsing columns that are not stored, such as the screenshot
+        # and movie URL lists in the full Steam export.
+        usecols=lambda column: column in GAME_DATA_COLUMNS,
+        chunksize=CSV_CHUNK_SIZE,
+    ) as chunks, ThreadPoolExecutor(max_workers=1) as reader:
+        # Parse the next chunk in the background while the current one is
+        # being inserted; both the CSV parser and the database driver
+        # release the GIL for most of their work.
+        pending = reader.submit(next_game_data_frame, chunks, event_id)
+        while (frame := pending.result()) is not None:
+            pending = reader.submit(next_game_data_frame, chunks, event_id)
+            yield frame
+
+
+def read_csv_ranges(
+    executor: Executor,
+    window: int,
+    csv_file_path: str,
+    ranges: List[Tuple[int, int]],
+    encoding: str = "utf-8",
+    delimiter: str = ",",
+    event_id: Optional[int] = None,
+) -> Iterator[pd.DataFrame]:
+    """
+    Read byte ranges of a CSV file as GameData frames in parallel.
+
+    At most `window` ranges are parsed or waiting to be inserted at a time,
+    so memory stays bounded when inserting is slower than parsing.
+
+    Args:
+        executor (Executor): The process pool parsing the ranges.
+        window (int): The number of ranges to parse ahead.
+        csv_file_path (str): The path to the CSV file.
+        ranges (List[Tuple[int, int]]): The byte ranges from csv_byte_ranges.
+        encoding (str, optional): The encoding of the CSV file. Defaults to "utf-8".
+        delimiter (str, optional): The delimiter used in the CSV file. Defaults to ",".
+        event_id (Optional[int], optional): The ID of the associated event. Defaults to None.
+
+    Yields:
+        pd.DataFrame: The converted ranges, in file order.
+    """
+    header_end = ranges[0][0]
+    pending = deque()
+    try:
+        for start, end in ranges:
+            pending.append(
+                executor.submit(
+                    read_game_data_range,
+                    csv_file_path,
+                    header_end,
+                    start,
+                    end,
+                    encoding,
+                    delimiter,
+                    event_id,
+                )
+            )
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def csv_byte_ranges(
+    csv_file_path: str, chunk_bytes: int = CSV_CHUNK_BYTES
+) -> List[Tuple[int, int]]:
+    """
+    Split the records of a CSV file into byte ranges of about chunk_bytes.
+
+    Ranges end at a newline preceded by an even number of quote characters,
+    so quoted fields spanning several lines are never split. This holds for
+    the ASCII-compatible encodings accepted for uploads.
+
+    Args:
+        csv_file_path (str): The path to the CSV file.
+        chunk_bytes (int, optional): The approximate size of a range.
+            Defaults to CSV_CHUNK_BYTES.
+
+    Returns:
+        List[Tuple[int, int]]: The start and end offsets of each range,
+            starting after the header line.
+    """
+    ranges = []
+    with open(csv_file_path, "rb") as f:
+        header = f.readline()
+        if not header.endswith(b"\n"):
+            return ranges
+        quotes = header.count(b'"')
+        start = end = len(header)
+        while block := f.read(chunk_bytes):
+            quotes += block.count(b'"')
+            end += len(block)
+            while quotes % 2 or not block.endswith(b"\n"):
+                block = f.readline()
+                if not block:
+                    break
+                quotes += block.count(b'"')
+                end += len(block)
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def read_game_data_range(
+    csv_file_path: str,
+    header_end: int,
+    start: int,
+    end: int,
+    encoding: str = "utf-8",
+    delimiter: str = ",",
+    event_id: Optional[int] = None,
+) -> pd.DataFrame:
+    """
+    Read a byte range of a CSV file and convert it into GameData columns.
+
+    Args:
+        csv_file_path (str): The path to the CSV file.
+        header_end (int): The offset just past the header line.
+        start (int): The offset of the first record of the range.
+        end (int): The offset just past the last record of the range.
+        encoding (str, optional): The encoding of the CSV file. Defaults to "utf-8".
+        delimiter (str, optional): The delimiter used in the CSV file. Defaults to ",".
+        event_id (Optional[int], optional): The ID of the associated event. Defaults to None.
+
+    Returns:
+        pd.DataFrame: The converted records of the range.
+    """
+    with open(csv_file_path, "rb") as f:
+        header = f.read(header_end)
+        f.seek(start)
+        records = f.read(end - start)
+    chunk = pd.read_csv(
+        io.BytesIO(header + records),
+        encoding=encoding,
+        delimiter=delimiter,
+        usecols=lambda column: column in GAME_DATA_COLUMNS,
+    )
+    return game_data_frame(chunk, event_id)
+
+
+def submit_ingest(event_id: int, download: bool = False) -> None:
+    """
+    Import the CSV file of an event in the background.
+
+    Args:
+        event_id (int): The ID of the pending event to import.
+        download (bool, optional): Whether the file has to be downloaded
+            from the event's original URL first. Defaults to False.
+    """
+    app = current_app._get_current_object()
+    app.extensions["ingest_executor"].submit(ingest_event, app, event_id, download)
+
+
+def ingest_event(app: Any, event_id: int, download: bool = False) -> None:
+    """
+    Import the CSV file of an event and record the outcome on the event.
+
+    The event is marked completed in the same transaction as its game data,
+    so a completed event always has all of its rows.
+
+    Args:
+        app (Flask): The application to run the import in.
+        event_id (int): The ID of the pending event to import.
+        download (bool, optional): Whether the file has to be downloaded
+            from the event's original URL first. Defaults to False.
+    """
+    with app.app_context():
+        event = db.session.get(Event, event_id)
+        try:
+            if download:
+                download_file(event.original_url, event.filepath)
+            event.status = "completed"
+            save_csv_to_db(event.filepath, event.encoding, event.delimiter, event.id)
+        except Exception as e:
+            db.session.rollback()
+            app.logger.error(f"Import of event {event_id} failed: {str(e)}")
+            event.status = "failed"
+            event.error = str(e)
+            db.session.commit()
+
+
+def download_file(url: str, file_path: str) -> None:
+    """
+    Download a file to disk without holding it in memory.
+
+    Args:
+        url (str): The URL of the file.
+        file_path (str): The path to write the file to.
+
+    Raises:
+        requests.RequestException: If the file could not be fetched.
+    """
+    with http_session.get(url, stream=True, timeout=10) as response:
+        response.raise_for_status()
+        with open(file_path, "wb") as f:
+            for chunk in response.iter_content(DOWNLOAD_CHUNK_SIZE):
+                f.write(chunk)
+
+
+def next_game_data_frame(
+    chunks: Iterator[pd.DataFrame], event_id: Optional[int] = None
+) -> Optional[pd.DataFrame]:
+    """
+    Read and convert the next chunk of a CSV file into GameData columns.
+
+    Args:
+        chunks (Iterator[pd.DataFrame]): The CSV chunk reader.
+        event_id (Optional[int], optional): The ID of the associated event. Defaults to None.
+
+    Returns:
+        Optional[pd.DataFrame]: The converted chunk, or None once the file
+            has been read.
+    """
+    chunk = next(chunks, None)
+    return None if chunk is None else game_data_frame(chunk, event_id)
+
+
+def game_data_frame(
+    data: pd.DataFrame, event_id: Optional[int] = None
+) -> pd.DataFrame:
+    """
+    Convert a raw game data DataFrame into GameData columns.
+
+    Args:
+        data (pd.DataFrame): The game data as read from the CSV file.
+        event_id (Optional[int], optional): The ID of the associated event. Defaults to None.
+
+    Returns:
+        pd.DataFrame: The game data renamed to GameData attributes, with
+            parsed release dates and integer columns cast to a nullable
+            integer dtype.
+    """
+    data = data[list(GAME_DATA_COLUMNS)].rename(columns=GAME_DATA_COLUMNS)
+    data["release_date"] = parse_dates(data["release_date"])
+    int_columns = [
+        column.key
+        for column in GameData.__table__.columns
+        if column.key in data and column.type.python_type is int
+    ]
+    data[int_columns] = data[int_columns].astype("Int64")
+    data["event_id"] = event_id
+    return data
+
+
+def frame_records(frame: pd.DataFrame) -> List[Dict[str, Any]]:
+    """
+    Convert a DataFrame into insert mappings with missing values as None.
+
+    Args:
+        frame (pd.DataFrame): The rows to convert.
+
+    Returns:
+        List[Dict[str, Any]]: One dictionary per row.
+    """
+    keys = frame.columns.tolist()
+    # Zipping whole-column lists is several times faster than
+    # to_dict(orient="records"), which goes through pandas per row.
+    columns = (column_values(frame[key]) for key in keys)
+    return [dict(zip(keys, row)) for row in zip(*columns)]
+
+
+def column_values(series: pd.Series) -> List[Any]:
+    """
+    Convert a column to a list of Python values with missing values as None.
+
+    Only columns that contain missing values are boxed to objects, so
+    complete numeric columns are converted straight from their arrays.
+
+    Args:
+        series (pd.Series): The column to convert.
+
+    Returns:
+        List[Any]: The column values.
+    """
+    if series.hasnans:
+        return series.astype(object).where(series.notnull(), None).tolist()
+    return series.tolist()
+
+
+def insert_game_data(frame: pd.DataFrame) -> None:
+    """
+    Insert a DataFrame of GameData columns in the current transaction.
+
+    PostgreSQL connections through psycopg2 stream the rows with COPY;
+    other backends use batched executemany inserts.
+
+    Args:
+        frame (pd.DataFrame): The rows to insert, as built by game_data_frame.
+    """
+    connection = db.session.connection()
+    if connection.dialect.driver == "psycopg2":
+        buffer = io.StringIO()
+        frame.to_csv(buffer, index=False, header=False, na_rep="\\N")
+        buffer.seek(0)
+        columns = ", ".join(frame.columns)
+        with connection.connection.dbapi_connection.cursor() as cursor:
+            cursor.copy_expert(
+                f"COPY {GameData.__tablename__} ({columns}) "
+                "FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+                buffer,
+            )
+    else:
+        bulk_insert(GameData, frame_records(frame))
+
+
+def bulk_insert(model: Any, records: Iterable[Dict[str, Any]]) -> None:
+    """
+    Insert mappings for a model in batches of INSERT_BATCH_SIZE rows.
+
+    Args:
+        model (Any): The mapped model class to insert into.
+        records (Iterable[Dict[str, Any]]): The rows to insert.
+    """
+    records = iter(records)
+    while batch := list(islice(records, INSERT_BATCH_SIZE)):
+        db.session.bulk_insert_mappings(model, batch, render_nulls=True)
+
+
+def _parse_query_date(value: str) -> str:
+    """
+    Validate a 'YYYY-MM-DD' query date and return it in storage format.
+
+    Args:
+        value (str): The date from the query string.
+
+    Returns:
+        str: The date in the 'YYYY-MM-DD' format release dates are stored in.
+    """
+    return datetime.strptime(value, "%Y-%m-%d").date().isoformat()
+
+
+def _column_filter(column: Any) -> Callable[[str], Any]:
+    """
+    Build the filter function for a GameData column.
+
+    Args:
+        column (Any): The GameData table column.
+
+    Returns:
+        Callable[[str], Any]: A function turning a query string value into
+            a filter condition on the column.
+    """
+    attr = getattr(GameData, column.key)
+    column_type = column.type.python_type
+    if column_type in (int, float):
+        return lambda value: attr == column_type(value)
+    if column_type is str:
+        return lambda value: attr.ilike(f"%{value}%")
+    if column_type is bool:
+        return lambda value: attr == (value.lower() in ["true", "1", "yes"])
+    return lambda value: attr == value
+
+
+def _prefix_filter(column: str) -> Callable[[str], Any]:
+    """
+    Build the case-insensitive prefix filter function for a GameData column.
+
+    Args:
+        column (str): The name of the GameData text column.
+
+    Returns:
+        Callable[[str], Any]: A function turning a query string value into
+            a condition matching column values starting with it.
+    """
+    attr = func.lower(getattr(GameData, column))
+    return lambda value: attr.startswith(value.lower(), autoescape=True)
+
+
+# Filter functions for every supported /query parameter, built once so
+# requests do not have to introspect the GameData columns.
+QUERY_FILTERS: Dict[str, Callable[[str], Any]] = {
+    **{column.key: _column_filter(column) for column in RESULT_COLUMNS},
+    **{f"{column}_prefix": _prefix_filter(column) for column in PREFIX_INDEX_COLUMNS},
+    "before": lambda value: GameData.release_date < _parse_query_date(value),
+    "after": lambda value: GameData.release_date > _parse_query_date(value),
+    "release_date": lambda value: GameData.release_date == _parse_query_date(value),
+    "min_price": lambda value: GameData.price >= float(value),
+    "max_price": lambda value: GameData.price <= float(value),
+}
+
+
 def query_data(
-    filters: Dict[str, Any], cursor: int, limit: int
-) -> Tuple[List[Dict[str, Any]], int]:
+    filters: Dict[str, Any], cursor: int, limit: int, with_total: bool = False
+) -> Tuple[Iterator[Dict[str, Any]], Optional[int]]:
     """
     Query game data based on filters and pagination parameters.
 
+    Pages are seeked by primary key rather than skipped with an offset, so
+    deep pages cost the same as the first one. One row past the limit is
+    fetched so callers can tell whether another page follows. Rows are
+    fetched from the database in batches as the returned iterator is
+    consumed, so a large page is never held in memory at once.
+
     Args:
         filters (Dict[str, Any]): A dictionary of filters to apply to the query.
-        cursor (int): The offset for pagination.
+        cursor (int): The ID of the last game data row of the previous page.
         limit (int): The maximum number of results to return.
+        with_total (bool, optional): Whether to count all matching rows.
+            Defaults to False.
 
     Returns:
-        A tuple containing the list of game data and the total count.
+        A tuple containing an iterator over up to limit + 1 game data rows
+        and the total count, or None if it was not requested.
     """
-    query = GameData.query
-
     filter_conditions = []
     for key, value in filters.items():
-        if key == "before":
-            filter_conditions.append(
-                GameData.release_date < datetime.strptime(
-                    value, "%Y-%m-%d").date()
-            )
-        elif key == "after":
-            filter_conditions.append(
-                GameData.release_date > datetime.strptime(
-                    value, "%Y-%m-%d").date()
-            )
-        elif key == "release_date":
-            filter_conditions.append(
-                GameData.release_date == datetime.strptime(
-                    value, "%Y-%m-%d").date()
-            )
-        elif key == "min_price":
-            filter_conditions.append(GameData.price >= float(value))
-        elif key == "max_price":
-            filter_conditions.append(GameData.price <= float(value))
-        elif hasattr(GameData, key):
-            column = getattr(GameData, key)
-            column_type = column.property.columns[0].type.python_type
-            if column_type in (int, float):
-                filter_conditions.append(column == column_type(value))
-            elif column_type is str:
-                filter_conditions.append(column.contains(value))
-            elif column_type is bool:
-                filter_conditions.append(
-                    column == (value.lower() in ["true", "1", "yes"])
-                )
-            else:
-                filter_conditions.append(column == value)
-        else:
-            print(f"Attribute {key} not found in GameData model")
-
-    if filter_conditions:
-        query = query.filter(and_(*filter_conditions))
+        build_filter = QUERY_FILTERS.get(key)
+        if build_filter is None:
+            current_app.logger.debug("Attribute %s not found in GameData model", key)
+            continue
+        filter_conditions.append(build_filter(value))
 
-    total = query.count()
-    results = query.offset(cursor).limit(limit).all()
+    if with_total:
+        # The window count returns the total alongside the page in one query.
+        matches = (
+            select(*RESULT_COLUMNS, func.count().over().label("total"))
+            .where(*filter_conditions)
+            .subquery()
+        )
+        stmt = (
+            select(matches)
+            .where(matches.c.id > cursor)
+            .order_by(matches.c.id)
+            .limit(limit + 1)
+        )
+    else:
+        stmt = (
+            select(*RESULT_COLUMNS)
+            .where(*filter_conditions, GameData.id > cursor)
+            .order_by(GameData.id)
+            .limit(limit + 1)
+        )
+    rows = iter(
+        db.session.execute(stmt, execution_options={"yield_per": QUERY_BATCH_SIZE})
+    )
+    total = None
+    if with_total:
+        first = next(rows, None)
+        if first is not None:
+            total = first.total
+            rows = chain([first], rows)
+        elif cursor:
+            # Past the last page there is no row to carry the count.
+            total = db.session.execute(
+                select(func.count(GameData.id)).where(*filter_conditions)
+            ).scalar()
+        else:
+            total = 0
 
-    return [game.to_dict() for game in results], total
+    # Rows are plain tuples led by the result columns; zip stops before the
+    # trailing count.
+    return (dict(zip(RESULT_KEYS, row)) for row in rows), total
 
 
 def query_aggregate_data(
@@ -272,161 +1084,235 @@ def query_aggregate_data(
     Returns:
         Dict[str, Any]: A dictionary containing the aggregated results.
     """
-    allowed_columns = ["price", "dlc_count", "positive", "negative"]
-
-    if column and column not in allowed_columns and column != "all":
+    if column and column not in AGGREGATE_COLUMNS and column != "all":
         raise ValueError(f"Column {column} is not allowed for aggregation")
 
-    query = db.session.query(GameData)
-    result = {}
     if column and column != "all":
-        column_attr = getattr(GameData, column)
-        data = [row[0] for row in query.with_entities(column_attr).all()]
-
-        if not data:
+        if aggregate == "all":
+            aggregates = AGGREGATES
+        elif aggregate in AGGREGATES:
+            aggregates = [aggregate]
+        else:
+            return {}
+        result = cached_column_statistics([column], aggregates)
+        if column not in result:
             raise ValueError(f"No data found for column {column}")
+        return result
+    return cached_column_statistics(AGGREGATE_COLUMNS, AGGREGATES)
 
-        if aggregate == "all":
-            result = {
-                column: {
-                    "min": min(data),
-                    "max": max(data),
-                    "median": np.median(data),
-                    "mean": np.mean(data),
-                    "range": max(data) - min(data),
-                    "iqr": np.percentile(data, 75) - np.percentile(data, 25),
-                    "std_dev": np.std(data),
-                    "variance": np.var(data),
-                    "sum": sum(data),
-                    "count": len(data),
-                    "percentiles": {
-                        "25th": np.percentile(data, 25),
-                        "50th": np.percentile(data, 50),
-                        "75th": np.percentile(data, 75),
-                    },
-                    "skewness": skew(data),
-                    "kurtosis": kurtosis(data),
-                }
-            }
-        elif aggregate == "min":
-            result = {column: {"min": min(data)}}
-        elif aggregate == "max":
-            result = {column: {"max": max(data)}}
-        elif aggregate == "median":
-            result = {column: {"median": np.median(data)}}
-        elif aggregate == "mean":
-            result = {column: {"mean": np.mean(data)}}
-        elif aggregate == "range":
-            result = {column: {"range": max(data) - min(data)}}
-        elif aggregate == "iqr":
-            result = {
-                column: {"iqr": np.percentile(
-                    data, 75) - np.percentile(data, 25)}
-            }
-        elif aggregate == "std_dev":
-            result = {column: {"std_dev": np.std(data)}}
-        elif aggregate == "variance":
-            result = {column: {"variance": np.var(data)}}
-        elif aggregate == "sum":
-            result = {column: {"sum": sum(data)}}
-        elif aggregate == "count":
-            result = {column: {"count": len(data)}}
-        elif aggregate == "percentiles":
-            result = {
-                column: {
-                    "percentiles": {
-                        "25th": np.percentile(data, 25),
-                        "50th": np.percentile(data, 50),
-                        "75th": np.percentile(data, 75),
-                    }
-                }
-            }
-        elif aggregate == "skewness":
-            result = {column: {"skewness": skew(data)}}
-        elif aggregate == "kurtosis":
-            result = {column: {"kurtosis": kurtosis(data)}}
-    elif column == "all" or not column:
-        for col in allowed_columns:
-            column_attr = getattr(GameData, col)
-            data = [row[0] for row in query.with_entities(column_attr).all()]
-            if not data:
-                continue
-            result[col] = {
-                "min": min(data),
-                "max": max(data),
-                "median": np.median(data),
-                "mean": np.mean(data),
-                "range": max(data) - min(data),
-                "iqr": np.percentile(data, 75) - np.percentile(data, 25),
-                "std_dev": np.std(data),
-                "variance": np.var(data),
-                "sum": sum(data),
-                "count": len(data),
-                "percentiles": {
-                    "25th": np.percentile(data, 25),
-                    "50th": np.percentile(data, 50),
-                    "75th": np.percentile(data, 75),
-                },
-                "skewness": skew(data),
-                "kurtosis": kurtosis(data),
-            }
 
+def cached_column_statistics(
+    columns: List[str], aggregates: List[str]
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Get column aggregates, computing them only once per game data version.
+
+    Results are kept in the application cache, which is shared between
+    workers when it is backed by Redis. When the cache is unavailable the
+    aggregates are computed for every request instead of failing it.
+
+    Args:
+        columns (List[str]): The GameData columns to aggregate.
+        aggregates (List[str]): The aggregates to compute for each column.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: The aggregates per column, omitting
+            columns without any data.
+    """
+    key = f"stats:{game_data_version()}:{','.join(columns)}:{','.join(aggregates)}"
+    try:
+        result = cache.get(key)
+    except Exception as e:
+        current_app.logger.warning(f"Could not read the stats cache: {str(e)}")
+        return column_statistics(columns, aggregates)
+    if result is None:
+        result = column_statistics(columns, aggregates)
+        try:
+            cache.set(key, result)
+        except Exception as e:
+            current_app.logger.warning(f"Could not write the stats cache: {str(e)}")
     return result
 
 
-def import_sample_data() -> None:
+def column_statistics(
+    columns: List[str], aggregates: List[str]
+) -> Dict[str, Dict[str, Any]]:
     """
-    Import sample game data from a CSV file into the database.
+    Compute aggregates for game data columns.
+
+    Every statistic the database can compute is fetched for all columns in
+    a single SELECT; only the remaining ones load column values into NumPy.
+
+    Args:
+        columns (List[str]): The GameData columns to aggregate.
+        aggregates (List[str]): The aggregates to compute for each column.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: The aggregates per column, omitting
+            columns without any data.
+    """
+    needed = {
+        stat
+        for aggregate in aggregates
+        for stat in _AGGREGATE_STATISTICS.get(aggregate, [aggregate])
+    }
+    sql_statistics = dict(_SQL_STATISTICS)
+    if db.session.get_bind().dialect.name == "postgresql":
+        sql_statistics.update(_POSTGRESQL_STATISTICS)
+    sql_stats = ["count"] + [
+        stat for stat in sql_statistics if stat in needed - {"count"}
+    ]
+    array_stats = [
+        stat for stat in _ARRAY_STATISTICS if stat in needed - set(sql_stats)
+    ]
+
+    row = iter(
+        db.session.query(
+            *(
+                sql_statistics[stat](getattr(GameData, name))
+                for name in columns
+                for stat in sql_stats
+            )
+        ).one()
+    )
+    stats = {}
+    for name in columns:
+        values = {stat: next(row) for stat in sql_stats}
+        if values["count"]:
+            stats[name] = {
+                stat: float(value) if isinstance(value, Decimal) else value
+                for stat, value in values.items()
+            }
+
+    if stats and array_stats:
+        data = pd.DataFrame.from_records(
+            iter(db.session.query(*(getattr(GameData, name) for name in stats))),
+            columns=list(stats),
+        )
+        for name, column_stats in stats.items():
+            values = data[name].dropna().to_numpy(dtype=np.float64)
+            column_stats.update(array_statistics(values, array_stats))
+
+    return {
+        name: {
+            aggregate: _AGGREGATE_RESULTS.get(aggregate, itemgetter(aggregate))(
+                column_stats
+            )
+            for aggregate in aggregates
+        }
+        for name, column_stats in stats.items()
+    }
+
+
+def array_statistics(data: np.ndarray, stats: List[str]) -> Dict[str, Any]:
+    """
+    Compute statistics of a column held in a NumPy array.
+
+    All quantiles come from a single np.quantile call, and the variance,
+    skewness and kurtosis share the same central moments.
+
+    Args:
+        data (np.ndarray): The column values, without missing values.
+        stats (List[str]): The statistics to compute, from _ARRAY_STATISTICS.
+
+    Returns:
+        Dict[str, Any]: The requested statistics.
     """
-    sample_csv_path = "sample_gamedata.csv"
-    data = pd.read_csv(sample_csv_path)
-    data = data.where(pd.notnull(data), None)
-    for _, row in data.iterrows():
-        game_data = GameData(
-            app_id=row["AppID"],
-            name=row["Name"],
-            release_date=parse_date(row["Release date"]),
-            required_age=row["Required age"],
-            price=row["Price"],
-            dlc_count=row["DLC count"],
-            about_game=row["About the game"],
-            supported_languages=row["Supported languages"],
-            windows=row["Windows"],
-            mac=row["Mac"],
-            linux=row["Linux"],
-            positive=row["Positive"],
-            negative=row["Negative"],
-            score_rank=row["Score rank"],
-            developers=row["Developers"],
-            publishers=row["Publishers"],
-            categories=row["Categories"],
-            genres=row["Genres"],
-            tags=row["Tags"],
-            event_id=0,
+    result = {}
+    if {"p25", "median", "p75"} & set(stats):
+        result["p25"], result["median"], result["p75"] = np.quantile(
+            data, [0.25, 0.5, 0.75]
         )
-        db.session.add(game_data)
-    db.session.commit()
+    if {"std_dev", "variance", "skewness", "kurtosis"} & set(stats):
+        # Central moments share one pass over the deviations instead of
+        # var, skew and kurtosis each re-deriving the mean and deviations.
+        deviations = data - data.mean()
+        squared = deviations * deviations
+        m2 = squared.mean()
+        result["variance"] = m2
+        result["std_dev"] = np.sqrt(m2)
+        # Like scipy.stats, report shape statistics of (near) constant
+        # data as NaN rather than amplifying rounding noise.
+        constant = m2 <= (np.finfo(np.float64).eps * data.mean()) ** 2
+        if "skewness" in stats:
+            m3 = (squared * deviations).mean()
+            result["skewness"] = np.nan if constant else m3 / m2**1.5
+        if "kurtosis" in stats:
+            m4 = (squared * squared).mean()
+            result["kurtosis"] = np.nan if constant else m4 / m2**2 - 3.0
+    return {stat: result[stat] for stat in stats}
+
+
+def seed_sample_data() -> bool:
+    """
+    Import the sample events and game data if the database has no game data.
+
+    On PostgreSQL an advisory lock makes sure only one of several workers
+    starting at the same time performs the import; the others skip it.
+
+    Returns:
+        bool: True if the sample data was imported, False otherwise.
+    """
+    if db.engine.dialect.name != "postgresql":
+        return _seed_if_empty()
+    with db.engine.connect() as lock_connection:
+        locked = lock_connection.execute(
+            text("SELECT pg_try_advisory_lock(:key)"), {"key": SEED_LOCK_KEY}
+        ).scalar()
+        if not locked:
+            return False
+        try:
+            return _seed_if_empty()
+        finally:
+            lock_connection.execute(
+                text("SELECT pg_advisory_unlock(:key)"), {"key": SEED_LOCK_KEY}
+            )
+
+
+def _seed_if_empty() -> bool:
+    """
+    Import the sample data unless the game data table already has rows.
+
+    Returns:
+        bool: True if the sample data was imported, False otherwise.
+    """
+    if db.session.query(GameData.id).first() is not None:
+        db.session.rollback()
+        return False
+    event_id = import_sample_events()
+    import_sample_data(event_id)
+    return True
+
+
+def import_sample_data(event_id: int) -> None:
+    """
+    Import sample game data from a CSV file into the database.
+
+    Args:
+        event_id (int): The ID of the sample event the game data belongs to.
+    """
+    save_csv_to_db("sample_gamedata.csv", event_id=event_id)
 
 
-def import_sample_events() -> None:
+def import_sample_events() -> int:
     """
     Import sample events data from a CSV file into the database.
+
+    The events get new IDs rather than the ones in the CSV file, so they
+    cannot collide with events already in the database. They are committed
+    together with the sample game data.
+
+    Returns:
+        int: The ID of the first sample event.
     """
     sample_events_path = "sample_events.csv"
     data = pd.read_csv(sample_events_path)
-    data = data.where(pd.notnull(data), None)
-    for _, row in data.iterrows():
-        event = Event(
-            original_url=row["original_url"],
-            mode=row["mode"],
-            altname=row["altname"],
-            filepath=row["filepath"],
-            encoding=row["encoding"],
-            delimiter=row["delimiter"],
-            created_at=(
-                datetime.utcnow() if pd.isnull(
-                    row["created_at"]) else row["created_at"]
-            ),
-        )
-        db.session.add(event)
-    db.session.commit()
+    records = frame_records(data[EVENT_COLUMNS])
+    now = datetime.utcnow()
+    for record in records:
+        record["created_at"] = record["created_at"] or now
+        record["status"] = "completed"
+    events = [Event(**record) for record in records]
+    db.session.add_all(events)
+    db.session.flush()
+    return events[0].id
@@ -20,27 +20,35 @@ Additionally, the script defines helper functions for:
 * Finding similar games based on a given game name.
 """
 
+import hmac
 import os
-import re
 import time
 from functools import wraps
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, Iterator, Optional, Tuple, Union
+from urllib.parse import urlparse
 
-import requests
 from dotenv import load_dotenv
-from flask import current_app, redirect, request
+from flask import Response, current_app, redirect, request, stream_with_context
 from flask_restx import Namespace, Resource, fields, reqparse
-from requests.exceptions import RequestException
 from sqlalchemy.exc import SQLAlchemyError
+from werkzeug.datastructures import FileStorage
 from werkzeug.exceptions import BadRequest
 from werkzeug.utils import secure_filename
 
 from . import db, limiter
-from .models import Event, GameData
-from .utils import get_similar_games, query_aggregate_data, query_data, save_csv_to_db
+from .models import Event
+from .utils import (
+    AGGREGATE_COLUMNS,
+    AGGREGATES,
+    get_similar_games,
+    query_aggregate_data,
+    query_data,
+    submit_ingest,
+)
 
 load_dotenv()
 API_SECRET_KEY = os.environ.get("API_SECRET_KEY")
+API_SECRET_KEY_BYTES = (API_SECRET_KEY or "").encode()
 authorizations = {"apikey": {"type": "apiKey",
                              "in": "header", "name": "X-API-Key"}}
 api = Namespace(
@@ -54,8 +62,10 @@ csv_upload = api.model(
     {"csv_file": fields.Raw(
         required=True, description="The CSV file to upload")},
 )
-UPLOAD_FOLDER = "uploads/"
 ALLOWED_EXTENSIONS = {"csv"}
+# Values accepted by /stats
+STATS_AGGREGATES = frozenset(["all", *AGGREGATES])
+STATS_COLUMNS = frozenset(["all", *AGGREGATE_COLUMNS])
 
 
 def validate_csv_params(encoding: str, delimiter: str) -> bool:
@@ -88,6 +98,76 @@ def allowed_file(filename: str) -> bool:
     return "." in filename and filename.rsplit(".", 1)[1].lower() in ALLOWED_EXTENSIONS
 
 
+def upload_path(filename: str, altname: Optional[str] = None) -> str:
+    """
+    Build the path an uploaded or imported CSV file is stored at.
+
+    Args:
+        filename (str): The original name of the file.
+        altname (Optional[str], optional): Alternative name for the file. Defaults to None.
+
+    Returns:
+        str: A timestamped path inside the upload folder.
+    """
+    name = secure_filename(f"{altname}.csv" if altname else filename)
+    return os.path.join(
+        current_app.config["UPLOAD_FOLDER"], f"{int(time.time())}_{name}"
+    )
+
+
+def save_upload(file: FileStorage, file_path: str) -> None:
+    """
+    Store an uploaded file at its upload path.
+
+    Uploads spooled to disk by the request are hard-linked into place
+    rather than copied; other streams are written out.
+
+    Args:
+        file (FileStorage): The uploaded file.
+        file_path (str): The path to store the file at.
+    """
+    name = getattr(file.stream, "name", None)
+    if isinstance(name, str) and os.path.isfile(name):
+        file.stream.flush()
+        try:
+            os.link(name, file_path)
+            return
+        except (AttributeError, OSError):
+            pass
+    file.save(file_path)
+
+
+def stream_results(
+    status: str, results: Iterator[Dict[str, Any]], limit: int
+) -> Iterator[str]:
+    """
+    Serialize a page of query results as JSON one row at a time.
+
+    Args:
+        status (str): The status message.
+        results (Iterator[Dict[str, Any]]): The result rows, with one row
+            past the limit if there is a page after this one.
+        limit (int): The maximum number of results to return.
+
+    Yields:
+        str: Consecutive parts of the JSON response body, ending with the
+            ID of the last row as the cursor of the next page, if any.
+    """
+    dumps = current_app.json.dumps
+    yield f'{{"status": {dumps(status)}, "results": ['
+    cursor = None
+    has_more = False
+    for index, row in enumerate(results):
+        if index == limit:
+            has_more = True
+            break
+        yield (", " if index else "") + dumps(row, sort_keys=False)
+        cursor = row["id"]
+    if not has_more:
+        cursor = None
+    yield f'], "cursor": {dumps(cursor)}, "has_more": {dumps(has_more)}}}\n'
+
+
 def check_secret_key() -> None:
     """
     Check if the provided API key is valid.
@@ -96,7 +176,12 @@ def check_secret_key() -> None:
         ApiException: If the API key is invalid or missing.
     """
     secret_key = request.headers.get("X-API-Key")
-    if not secret_key or secret_key != API_SECRET_KEY:
+    # Constant-time comparison, so response timing does not leak the key
+    if (
+        not secret_key
+        or not API_SECRET_KEY
+        or not hmac.compare_digest(secret_key.encode(), API_SECRET_KEY_BYTES)
+    ):
         api.abort(401, "Invalid or missing API Key")
 
 
@@ -110,11 +195,10 @@ def is_valid_csv_url(url: str) -> bool:
     Returns:
         bool: True if the URL is valid and ends with .csv, False otherwise.
     """
-    # Regex pattern for validating a URL that ends with .csv
-    pattern = re.compile(
-        r"http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+\.csv$"
-    )
-    return bool(pattern.match(url))
+    if not url.endswith(".csv"):
+        return False
+    parts = urlparse(url)
+    return parts.scheme in ("http", "https") and bool(parts.netloc)
 
 
 def require_api_key(func: Any) -> Any:
@@ -180,7 +264,7 @@ class UploadCSV(Resource):
     @api.expect(csv_upload_parser)
     @limiter.limit("2 per minute")
     @require_api_key
-    def post(self) -> Tuple[Dict[str, str], int]:
+    def post(self) -> Tuple[Dict[str, Any], int]:
         """
         Upload and process a CSV file.
 
@@ -195,13 +279,8 @@ class UploadCSV(Resource):
             return {"error": "Invalid encoding or delimiter"}, 400
         if file and allowed_file(file.filename):
             try:
-                filename = (
-                    f"{int(time.time())}_{altname}.csv"
-                    if altname
-                    else f"{int(time.time())}_{secure_filename(file.filename)}"
-                )
-                file_path = os.path.join(UPLOAD_FOLDER, filename)
-                file.save(file_path)
+                file_path = upload_path(file.filename, altname)
+                save_upload(file, file_path)
                 event = Event(
                     original_url=None,
                     mode="upload",
@@ -212,8 +291,11 @@ class UploadCSV(Resource):
                 )
                 db.session.add(event)
                 db.session.commit()
-                save_csv_to_db(file_path, encoding, delimiter, event.id)
-                return {"message": "CSV data uploaded and imported successfully"}, 201
+                submit_ingest(event.id)
+                return {
+                    "message": "CSV file uploaded, import started",
+                    "event_id": event.id,
+                }, 202
             except IOError as e:
                 return {"error": f"File I/O error: {str(e)}"}, 500
             except BadRequest as e:
@@ -246,7 +328,7 @@ class ImportCSV(Resource):
     @api.expect(csv_import_parser)
     @limiter.limit("2 per minute")
     @require_api_key
-    def post(self) -> Tuple[Dict[str, str], int]:
+    def post(self) -> Tuple[Dict[str, Any], int]:
         """
         Query game data based on various filters.
 
@@ -264,39 +346,22 @@ class ImportCSV(Resource):
             }, 400
         if validate_csv_params(encoding, delimiter) is False:
             return {"error": "Invalid encoding or delimiter"}, 400
-        if not os.path.exists(UPLOAD_FOLDER):
-            os.makedirs(UPLOAD_FOLDER)
-        os.chmod(UPLOAD_FOLDER, 0o755)
         try:
-            response = requests.get(file_url, stream=True, timeout=10)
-            if response.status_code == 200:
-                filename = (
-                    f"{int(time.time())}_{altname}.csv"
-                    if altname
-                    else f"{int(time.time())}_{secure_filename(file_url.rsplit('/', 1)[-1])}"
-                )
-                file_path = os.path.join(UPLOAD_FOLDER, filename)
-                with open(file_path, "wb") as f:
-                    f.write(response.content)
-                event = Event(
-                    original_url=file_url,
-                    mode="import",
-                    altname=altname,
-                    filepath=file_path,
-                    encoding=encoding,
-                    delimiter=delimiter,
-                )
-                db.session.add(event)
-                db.session.commit()
-                save_csv_to_db(file_path, encoding, delimiter, event.id)
-                return {"message": "CSV data imported successfully from URL"}, 201
+            event = Event(
+                original_url=file_url,
+                mode="import",
+                altname=altname,
+                filepath=upload_path(file_url.rsplit("/", 1)[-1], altname),
+                encoding=encoding,
+                delimiter=delimiter,
+            )
+            db.session.add(event)
+            db.session.commit()
+            submit_ingest(event.id, download=True)
             return {
-                "error": f"Failed to fetch file: {file_url}. Code: {response.status_code}"
-            }, 400
-        except RequestException as e:
-            return {"error": f"Failed to fetch file: {str(e)}"}, 400
-        except IOError as e:
-            return {"error": f"File I/O error: {str(e)}"}, 500
+                "message": "CSV import from URL started",
+                "event_id": event.id,
+            }, 202
         except SQLAlchemyError as e:
             return {"error": f"Database error: {str(e)}"}, 500
         except Exception as e:
@@ -367,10 +432,22 @@ class QueryData(Resource):
                 "type": "string",
                 "format": "date",
             },
+            "name_prefix": {
+                "description": "Start of the name of the game",
+                "type": "string",
+            },
+            "developers_prefix": {
+                "description": "Start of the developers of the game",
+                "type": "string",
+            },
+            "publishers_prefix": {
+                "description": "Start of the publishers of the game",
+                "type": "string",
+            },
             "min_price": {"description": "Minimum price of the game", "type": "number"},
             "max_price": {"description": "Maximum price of the game", "type": "number"},
             "cursor": {
-                "description": "Cursor for pagination",
+                "description": "Cursor for pagination, the cursor returned with the previous page",
                 "type": "integer",
                 "default": 0,
             },
@@ -379,26 +456,37 @@ class QueryData(Resource):
                 "type": "integer",
                 "default": 10,
             },
+            "with_total": {
+                "description": "Count all matching games",
+                "type": "boolean",
+                "default": False,
+            },
         }
     )
     @limiter.limit("10 per minute")
-    def get(self) -> Tuple[Dict[str, Any], int]:
+    def get(self) -> Union[Response, Tuple[Dict[str, Any], int]]:
         """
         Query game data based on various filters.
 
         Returns:
-            Tuple[Dict[str, Any], int]: A tuple containing query results and HTTP status code.
+            Union[Response, Tuple[Dict[str, Any], int]]: The streamed query
+                results, or an error and HTTP status code.
         """
         filters = request.args.to_dict()
-        cursor = int(filters.pop("cursor", 0))
-        limit = int(filters.pop("limit", 10))
+        with_total = filters.pop("with_total", "").lower() in ["true", "1", "yes"]
         try:
-            results, total = query_data(filters, cursor, limit)
-            return {
-                "status": f"{total} found",
-                "results": results,
-                "cursor": cursor + limit if cursor + limit < total else None,
-            }, 200
+            cursor = int(filters.pop("cursor", 0))
+            limit = int(filters.pop("limit", 10))
+            if cursor < 0 or limit < 1:
+                return {
+                    "error": "Invalid input: cursor must be at least 0 and limit at least 1"
+                }, 400
+            results, total = query_data(filters, cursor, limit, with_total)
+            status = "ok" if total is None else f"{total} found"
+            return current_app.response_class(
+                stream_with_context(stream_results(status, results, limit)),
+                mimetype="application/json",
+            )
         except ValueError as e:
             return {"error": f"Invalid input: {str(e)}"}, 400
         except SQLAlchemyError as e:
@@ -465,31 +553,10 @@ class StatsData(Resource):
         aggregate = request.args.get("aggregate")
         column = request.args.get("column")
 
-        if aggregate not in [
-            "all",
-            "min",
-            "max",
-            "median",
-            "mean",
-            "range",
-            "iqr",
-            "std_dev",
-            "variance",
-            "sum",
-            "count",
-            "percentiles",
-            "skewness",
-            "kurtosis",
-        ]:
+        if aggregate not in STATS_AGGREGATES:
             return {"error": "Invalid aggregate function"}, 400
 
-        if column and column not in [
-            "all",
-            "price",
-            "dlc_count",
-            "positive",
-            "negative",
-        ]:
+        if column and column not in STATS_COLUMNS:
             return {"error": f"Column {column} does not exist or is not allowed"}, 400
 
         try:
@@ -542,6 +609,33 @@ class SimilarGames(Resource):
         return {"error": "Please provide a game name"}, 400
 
 
+@api.route("/events/<int:event_id>")
+class EventStatus(Resource):
+    """
+    Resource endpoint for checking the status of a CSV import.
+
+    Methods:
+        get(event_id): Handles GET requests for an import event.
+    """
+
+    @api.doc(security="apikey")
+    @require_api_key
+    def get(self, event_id: int) -> Tuple[Dict[str, Any], int]:
+        """
+        Get an import event and its status.
+
+        Args:
+            event_id (int): The ID of the event.
+
+        Returns:
+            Tuple[Dict[str, Any], int]: A tuple containing the event and HTTP status code.
+        """
+        event = db.session.get(Event, event_id)
+        if event is None:
+            return {"error": f"Event {event_id} not found"}, 404
+        return event.to_dict(), 200
+
+
 @api.route("/ping")
 class Ping(Resource):
     """
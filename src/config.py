@@ -6,6 +6,36 @@ such as database URI, secret keys, and rate limit settings.
 """
 
 import os
+from typing import Any, Dict
+
+from sqlalchemy.engine import make_url
+
+
+def engine_options(database_url: str) -> Dict[str, Any]:
+    """
+    Build the SQLAlchemy engine options for a database URL.
+
+    SQLite engines use pools without a fixed size, so the connection pool
+    sizing only applies to other databases.
+
+    Args:
+        database_url (str): The database connection URL.
+
+    Returns:
+        Dict[str, Any]: The engine options.
+    """
+    options = {
+        "pool_pre_ping": True,
+        "query_cache_size": int(os.environ.get("DB_QUERY_CACHE_SIZE", "1200")),
+    }
+    if make_url(database_url).get_backend_name() != "sqlite":
+        options.update(
+            pool_size=int(os.environ.get("DB_POOL_SIZE", "20")),
+            max_overflow=int(os.environ.get("DB_MAX_OVERFLOW", "10")),
+            pool_timeout=int(os.environ.get("DB_POOL_TIMEOUT", "5")),
+            pool_recycle=1800,
+        )
+    return options
 
 
 class Config:
@@ -16,12 +46,65 @@ class Config:
         SECRET_KEY (str): Secret key for securing session data.
         SQLALCHEMY_DATABASE_URI (str): Database URI for SQLAlchemy.
         RATELIMIT_DEFAULT (str): Default rate limit setting.
+        RATELIMIT_STORAGE_URI (str): Storage backend shared by all workers
+            for rate limit counters.
+        RATELIMIT_STRATEGY (str): Rate limiting strategy.
+        RATELIMIT_STORAGE_OPTIONS (dict): Options for the rate limit storage
+            connection.
+        RATELIMIT_SWALLOW_ERRORS (bool): Whether requests are let through when
+            the rate limit storage is unavailable.
         SQLALCHEMY_TRACK_MODIFICATIONS (bool): Whether to track modifications in SQLAlchemy.
+        SQLALCHEMY_ENGINE_OPTIONS (dict): Connection pool and compiled
+            statement cache settings for the engine.
         API_SECRET_KEY (str): Secret key for API authentication.
+        SEED_SAMPLE_DATA (bool): Whether to import the sample data into an
+            empty database on startup.
+        UPLOAD_FOLDER (str): Directory where uploaded and imported CSV files
+            are stored.
+        MAX_CONTENT_LENGTH (int): Maximum request size in bytes (150MB).
+        CACHE_TYPE (str): Flask-Caching backend for computed results; use
+            RedisCache to share them between workers.
+        CACHE_REDIS_URL (str): Redis URL used by the RedisCache backend.
+        CACHE_OPTIONS (dict): Options for the RedisCache connection.
+        CACHE_DEFAULT_TIMEOUT (int): Seconds a cached result is kept.
+        INGEST_WORKERS (int): Number of background threads importing
+            uploaded CSV files.
+        INGEST_PROCESSES (int): Number of worker processes parsing large
+            CSV files during imports. 0 parses them in the importing thread.
+        SIMILARITY_INDEX_PATH (str): File where the fitted similarity index
+            is saved for reuse across workers and restarts. Defaults to
+            similarity_index.joblib in the instance folder; empty disables it.
     """
 
     SECRET_KEY = os.environ.get("SECRET_KEY")
-    SQLALCHEMY_DATABASE_URI = os.environ.get("DATABASE_URL")
+    SQLALCHEMY_DATABASE_URI = os.environ.get("DATABASE_URL", "sqlite:///app.db")
     RATELIMIT_DEFAULT = os.environ.get("RATELIMIT_DEFAULT")
+    RATELIMIT_STORAGE_URI = os.environ.get("RATELIMIT_STORAGE_URI", "memory://")
+    RATELIMIT_STRATEGY = os.environ.get("RATELIMIT_STRATEGY", "fixed-window")
+    RATELIMIT_STORAGE_OPTIONS = {
+        "socket_timeout": float(os.environ.get("RATELIMIT_STORAGE_TIMEOUT", "0.1"))
+    }
+    RATELIMIT_SWALLOW_ERRORS = True
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    SQLALCHEMY_ENGINE_OPTIONS = engine_options(
+        os.environ.get("DATABASE_URL", "sqlite:///app.db")
+    )
     API_SECRET_KEY = os.environ.get("API_SECRET_KEY")
+    SEED_SAMPLE_DATA = os.environ.get("SEED_SAMPLE_DATA", "true").lower() in [
+        "true",
+        "1",
+        "yes",
+    ]
+    UPLOAD_FOLDER = "uploads/"
+    MAX_CONTENT_LENGTH = 150 * 1000 * 1000
+    CACHE_TYPE = os.environ.get("CACHE_TYPE", "SimpleCache")
+    CACHE_REDIS_URL = os.environ.get("CACHE_REDIS_URL")
+    CACHE_OPTIONS = (
+        {"socket_timeout": float(os.environ.get("CACHE_REDIS_TIMEOUT", "0.1"))}
+        if CACHE_TYPE == "RedisCache"
+        else {}
+    )
+    CACHE_DEFAULT_TIMEOUT = int(os.environ.get("CACHE_DEFAULT_TIMEOUT", "3600"))
+    INGEST_WORKERS = int(os.environ.get("INGEST_WORKERS", "2"))
+    INGEST_PROCESSES = int(os.environ.get("INGEST_PROCESSES", "0"))
+    SIMILARITY_INDEX_PATH = os.environ.get("SIMILARITY_INDEX_PATH")
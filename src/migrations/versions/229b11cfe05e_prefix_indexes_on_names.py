@@ -0,0 +1,46 @@
+"""prefix indexes on names
+
+Revision ID: 229b11cfe05e
+Revises: eb80805cc669
+Create Date: 2026-10-15 21:53:48.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '229b11cfe05e'
+down_revision = 'eb80805cc669'
+branch_labels = None
+depends_on = None
+
+COLUMNS = ["name", "developers", "publishers"]
+
+
+def game_data_indexes():
+    indexes = sa.inspect(op.get_bind()).get_indexes("game_data")
+    return {index["name"] for index in indexes}
+
+
+def upgrade():
+    # Pattern indexes are only used on PostgreSQL.
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    existing = game_data_indexes()
+    for column in COLUMNS:
+        name = f"ix_game_data_{column}_prefix"
+        if name not in existing:
+            op.create_index(
+                name, "game_data", [sa.text(f"lower({column}) text_pattern_ops")]
+            )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    existing = game_data_indexes()
+    for column in COLUMNS:
+        name = f"ix_game_data_{column}_prefix"
+        if name in existing:
+            op.drop_index(name, table_name="game_data")
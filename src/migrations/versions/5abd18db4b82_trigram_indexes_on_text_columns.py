@@ -0,0 +1,59 @@
+"""trigram indexes on text columns
+
+Revision ID: 5abd18db4b82
+Revises: d8ab71766f92
+Create Date: 2026-10-15 21:31:56.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5abd18db4b82'
+down_revision = 'd8ab71766f92'
+branch_labels = None
+depends_on = None
+
+# The name column got its trigram index in the previous revision.
+COLUMNS = [
+    "about_game",
+    "supported_languages",
+    "developers",
+    "publishers",
+    "categories",
+    "genres",
+    "tags",
+]
+
+
+def game_data_indexes():
+    indexes = sa.inspect(op.get_bind()).get_indexes("game_data")
+    return {index["name"] for index in indexes}
+
+
+def upgrade():
+    # Trigram indexes are only used on PostgreSQL.
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    existing = game_data_indexes()
+    for column in COLUMNS:
+        name = f"ix_game_data_{column}_trgm"
+        if name not in existing:
+            op.create_index(
+                name,
+                "game_data",
+                [column],
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+            )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    existing = game_data_indexes()
+    for column in COLUMNS:
+        name = f"ix_game_data_{column}_trgm"
+        if name in existing:
+            op.drop_index(name, table_name="game_data")
@@ -0,0 +1,45 @@
+"""trigram index on game names
+
+Revision ID: 6f436310ad12
+Revises: e024c9ca09ef
+Create Date: 2026-10-15 21:22:17.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '6f436310ad12'
+down_revision = 'e024c9ca09ef'
+branch_labels = None
+depends_on = None
+
+NAME = "ix_game_data_name_trgm"
+
+
+def game_data_indexes():
+    indexes = sa.inspect(op.get_bind()).get_indexes("game_data")
+    return {index["name"] for index in indexes}
+
+
+def upgrade():
+    # Trigram indexes are only used on PostgreSQL.
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    if NAME not in game_data_indexes():
+        op.create_index(
+            NAME,
+            "game_data",
+            ["name"],
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    if NAME in game_data_indexes():
+        op.drop_index(NAME, table_name="game_data")
@@ -0,0 +1,42 @@
+"""event import status
+
+Revision ID: 970c8f719ac5
+Revises: 5abd18db4b82
+Create Date: 2026-10-15 21:40:11.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '970c8f719ac5'
+down_revision = '5abd18db4b82'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    columns = {
+        column["name"] for column in sa.inspect(op.get_bind()).get_columns("event")
+    }
+    # Databases created by db.create_all() already have the columns.
+    if "status" not in columns:
+        # Imports used to finish within the upload request.
+        op.add_column(
+            "event",
+            sa.Column(
+                "status",
+                sa.String(length=20),
+                nullable=False,
+                server_default="completed",
+            ),
+        )
+    if "error" not in columns:
+        op.add_column("event", sa.Column("error", sa.Text(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table("event") as batch_op:
+        batch_op.drop_column("error")
+        batch_op.drop_column("status")
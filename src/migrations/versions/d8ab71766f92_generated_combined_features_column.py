@@ -0,0 +1,46 @@
+"""generated combined_features column
+
+Revision ID: d8ab71766f92
+Revises: 6f436310ad12
+Create Date: 2026-10-15 21:24:42.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd8ab71766f92'
+down_revision = '6f436310ad12'
+branch_labels = None
+depends_on = None
+
+COMBINED_FEATURES = (
+    "COALESCE(about_game, '') || ' ' || COALESCE(categories, '') || ' ' "
+    "|| COALESCE(genres, '') || ' ' || COALESCE(tags, '')"
+)
+
+
+def upgrade():
+    bind = op.get_bind()
+    columns = {column["name"] for column in sa.inspect(bind).get_columns("game_data")}
+    # Databases created by db.create_all() already have the column.
+    if "combined_features" in columns:
+        return
+    combined_features = sa.Column(
+        "combined_features",
+        sa.Text(),
+        sa.Computed(COMBINED_FEATURES, persisted=True),
+    )
+    if bind.dialect.name == "postgresql":
+        op.add_column("game_data", combined_features)
+    else:
+        # SQLite cannot add a stored generated column to an existing table,
+        # so the table is copied into a new one that has it.
+        with op.batch_alter_table("game_data", recreate="always") as batch_op:
+            batch_op.add_column(combined_features)
+
+
+def downgrade():
+    with op.batch_alter_table("game_data") as batch_op:
+        batch_op.drop_column("combined_features")
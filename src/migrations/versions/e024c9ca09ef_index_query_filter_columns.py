@@ -0,0 +1,42 @@
+"""index query filter columns
+
+Revision ID: e024c9ca09ef
+Revises:
+Create Date: 2026-10-15 21:21:04.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e024c9ca09ef'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+INDEXES = {
+    "ix_game_data_app_id": ["app_id"],
+    "ix_game_data_release_date": ["release_date"],
+    "ix_game_data_price_release_date": ["price", "release_date"],
+}
+
+
+def game_data_indexes():
+    indexes = sa.inspect(op.get_bind()).get_indexes("game_data")
+    return {index["name"] for index in indexes}
+
+
+def upgrade():
+    # Databases created by db.create_all() already have the indexes.
+    existing = game_data_indexes()
+    for name, columns in INDEXES.items():
+        if name not in existing:
+            op.create_index(name, "game_data", columns)
+
+
+def downgrade():
+    existing = game_data_indexes()
+    for name in INDEXES:
+        if name in existing:
+            op.drop_index(name, table_name="game_data")
@@ -0,0 +1,34 @@
+"""index review counts
+
+Revision ID: eb80805cc669
+Revises: 970c8f719ac5
+Create Date: 2026-10-15 21:52:30.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'eb80805cc669'
+down_revision = '970c8f719ac5'
+branch_labels = None
+depends_on = None
+
+NAME = "ix_game_data_positive_negative"
+
+
+def game_data_indexes():
+    indexes = sa.inspect(op.get_bind()).get_indexes("game_data")
+    return {index["name"] for index in indexes}
+
+
+def upgrade():
+    # Databases created by db.create_all() already have the index.
+    if NAME not in game_data_indexes():
+        op.create_index(NAME, "game_data", ["positive", "negative"])
+
+
+def downgrade():
+    if NAME in game_data_indexes():
+        op.drop_index(NAME, table_name="game_data")
@@ -4,7 +4,8 @@ run.py
 This script creates and runs the Flask application.
 
 It imports the create_app function from the app module to initialize the Flask app,
-and starts the Flask development server when run directly.
+and starts the Flask development server when run directly. The app is only
+created then, as ingest worker processes import this module again.
 
 Usage:
     python run.py
@@ -13,7 +14,6 @@ Usage:
 
 from app import create_app
 
-app = create_app()
-
 if __name__ == "__main__":
+    app = create_app()
     app.run(debug=True, host="0.0.0.0", port=5123)
\ No newline at end of file
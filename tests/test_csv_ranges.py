@@ -0,0 +1,83 @@
+"""
+Tests for splitting CSV imports into byte ranges parsed in parallel.
+"""
+
+import multiprocessing
+import os
+import sys
+import tempfile
+import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "src"))
+
+from app.utils import csv_byte_ranges, read_csv_chunks, read_csv_ranges  # noqa: E402
+
+SAMPLE_GAMEDATA = os.path.join(
+    os.path.dirname(__file__), os.pardir, "src", "sample_gamedata.csv"
+)
+
+
+class CsvByteRangesTest(unittest.TestCase):
+    """Tests for csv_byte_ranges and read_csv_ranges."""
+
+    def setUp(self) -> None:
+        with open(SAMPLE_GAMEDATA, "rb") as f:
+            header, *rows = f.read().splitlines(keepends=True)
+        # Quoted fields spanning several lines, with escaped quotes, placed
+        # where small ranges would otherwise be cut inside them.
+        multiline = (
+            b'100,999001,"Line ""Break"" Game","Oct 21, 2008",0,4.99,0,'
+            b'"First line\nsecond ""quoted"" line\n\nlast line",English,'
+            b'True,False,False,10,2,,Dev,Pub,"Single-player\nCo-op",Indie,Tags\n'
+        )
+        records = b"".join(rows[:40] + [multiline] * 5 + rows[40:])
+        f = tempfile.NamedTemporaryFile(suffix=".csv", delete=False)
+        with f:
+            # No newline after the last record.
+            f.write(header + records.rstrip(b"\n"))
+        self.addCleanup(os.unlink, f.name)
+        self.path = f.name
+        self.header_size = len(header)
+        self.expected = pd.concat(read_csv_chunks(self.path), ignore_index=True)
+
+    def test_ranges_cover_records(self) -> None:
+        ranges = csv_byte_ranges(self.path, chunk_bytes=256)
+        self.assertGreater(len(ranges), 10)
+        self.assertEqual(ranges[0][0], self.header_size)
+        self.assertEqual(ranges[-1][1], os.path.getsize(self.path))
+        for (_, end), (start, _) in zip(ranges, ranges[1:]):
+            self.assertEqual(end, start)
+
+    def test_ranges_match_sequential_read(self) -> None:
+        ranges = csv_byte_ranges(self.path, chunk_bytes=256)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            frames = list(read_csv_ranges(executor, 3, self.path, ranges))
+        self.assertEqual(sum(len(frame) for frame in frames), len(self.expected))
+        pd.testing.assert_frame_equal(
+            pd.concat(frames, ignore_index=True), self.expected
+        )
+        self.assertEqual(
+            (self.expected["name"] == 'Line "Break" Game').sum(), 5
+        )
+
+    def test_ranges_in_worker_processes(self) -> None:
+        ranges = csv_byte_ranges(self.path, chunk_bytes=4096)
+        with ProcessPoolExecutor(
+            max_workers=2, mp_context=multiprocessing.get_context("forkserver")
+        ) as executor:
+            frames = list(read_csv_ranges(executor, 3, self.path, ranges))
+        pd.testing.assert_frame_equal(
+            pd.concat(frames, ignore_index=True), self.expected
+        )
+
+    def test_header_only_file(self) -> None:
+        with open(self.path, "wb") as f:
+            f.write(b"AppID,Name")
+        self.assertEqual(csv_byte_ranges(self.path), [])
+
+
+if __name__ == "__main__":
+    unittest.main()